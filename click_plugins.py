@@ -37,9 +37,15 @@ See :func:`with_plugins`.
 """
 
 
+import ast
+import collections
+import functools
 import importlib.metadata
+import importlib.util
 import os
+import re
 import sys
+import threading
 import traceback
 
 import click
@@ -48,7 +54,7 @@ import click
 __version__ = '2.0.1'
 
 
-def with_plugins(entry_points):
+def with_plugins(entry_points, path=None, lazy=False):
 
     """Decorator for loading and attaching plugins to a ``click.Group()``.
 
@@ -81,10 +87,29 @@ def with_plugins(entry_points):
     >>> @with_plugins("group2")
     >>> def group():
     ...     '''Group'''
+    >>>
+    >>> @with_plugins('group_name', path=['/opt/cli/plugins'])
+    >>> @click.group()
+    >>> def group():
+    ...     '''Group'''
+    >>>
+    >>> @with_plugins('group_name', lazy=True)
+    >>> @click.group()
+    >>> def group():
+    ...     '''Group'''
 
     :param str or EntryPoint or sequence[EntryPoint] entry_points:
         Entry point group name, a single ``importlib.metadata.EntryPoint()``,
         or a sequence of ``EntryPoint()``s.
+    :param sequence[str or os.PathLike] or None path:
+        Only search these directories for distributions offering entry points
+        instead of every ``sys.path`` entry. Only valid when ``entry_points``
+        is a group name. Plugins are still imported through ``sys.path``.
+    :param bool lazy:
+        Register a ``LazyCommand()`` for each entry point instead of loading
+        it immediately. The plugin is loaded the first time it is needed.
+        Plugins whose name cannot be determined from their source code are
+        loaded immediately.
 
     :rtype function:
     """
@@ -98,7 +123,21 @@ def with_plugins(entry_points):
     #
     # from importlib.metadata import entry_points
     #
-    # breaks this ability.
+    # breaks this ability. The same applies to:
+    #
+    #     importlib.metadata.distributions()
+
+    if path is not None and not isinstance(entry_points, str):
+        raise ValueError(
+            f"'path' can only be used with an entry point group name, not:"
+            f" {repr(entry_points)}")
+
+    # A single directory would otherwise be treated as a sequence of
+    # one-character directories, or fail later with a confusing error.
+    if isinstance(path, (str, os.PathLike)):
+        raise TypeError(
+            f"'path' must be a sequence of directories, not a single"
+            f" directory: {repr(path)}")
 
     def decorator(group):
         if not isinstance(group, click.Group):
@@ -107,7 +146,10 @@ def with_plugins(entry_points):
                 f" 'click.Group()' not: {repr(group)}")
 
         # Load 'EntryPoint()' objects.
-        if isinstance(entry_points, str):
+        if isinstance(entry_points, str) and path is not None:
+            all_entry_points = _entry_points_from_path(entry_points, path)
+
+        elif isinstance(entry_points, str):
 
             # Older versions of Python do not support filtering.
             if sys.version_info >= (3, 10):
@@ -126,10 +168,21 @@ def with_plugins(entry_points):
         else:
             all_entry_points = entry_points
 
+        # Names of plugins attached without 'lazy=True'. Otherwise these are
+        # indistinguishable from any other command. See 'warm_plugins()'.
+        if not hasattr(group, '_eager_plugins'):
+            group._eager_plugins = set()
+
         for ep in all_entry_points:
 
+            if lazy:
+                group.add_command(LazyCommand(ep))
+                continue
+
             try:
-                group.add_command(ep.load())
+                cmd = ep.load()
+                group.add_command(cmd)
+                group._eager_plugins.add(cmd.name)
 
             # Catch all exceptions (technically not 'BaseException') and
             # instead register a special 'BrokenCommand()'. Otherwise, a single
@@ -137,6 +190,7 @@ def with_plugins(entry_points):
             # inoperable. 'BrokenCommand()' explains the situation to users.
             except Exception as e:
                 group.add_command(BrokenCommand(ep, e))
+                group._eager_plugins.add(ep.name)
 
         return group
 
@@ -163,6 +217,8 @@ class BrokenCommand(click.Command):
 
         super().__init__(entry_point.name)
 
+        self.entry_point = entry_point
+
         # There are several ways to get a traceback from an exception, but
         # 'TracebackException()' seems to be the most portable across actively
         # supported versions of Python.
@@ -222,6 +278,797 @@ class BrokenCommand(click.Command):
         return args
 
 
+def _delegated(name):
+
+    """Property for a ``LazyCommand()`` attribute taken from the plugin.
+
+    ``click.Command.__init__()`` sets these attributes, so the property has a
+    setter that discards the value.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name.
+
+    Returns
+    -------
+    property
+    """
+
+    def getter(self):
+        return getattr(self.load(), name)
+
+    def setter(self, value):
+        pass
+
+    return property(getter, setter)
+
+
+class LazyCommand(click.Command):
+
+    """Represents a plugin ``click.Command()`` that has not been loaded yet.
+
+    The entry point is loaded the first time the command is executed, or
+    information about the command is required, like its short help. Loading
+    is thread-safe and happens at most once per instance. All callers receive
+    the same ``click.Command()``, or the same ``BrokenCommand()`` if the entry
+    point could not be loaded.
+
+    The command's name and short help are read from the plugin's source code
+    without importing it. See ``_static_command_info()``. If that is not
+    possible, the entry point is loaded immediately to determine its name.
+    Either way, the command has the same name as the ``click.Command()`` the
+    entry point references.
+    """
+
+    def __init__(self, entry_point):
+
+        """
+        :param importlib.metadata.EntryPoint entry_point:
+            Entry point to load on demand.
+        """
+
+        # Required by 'load()', which may be called before
+        # 'click.Command.__init__()'.
+        self.entry_point = entry_point
+        self._command = None
+        self._lock = threading.Lock()
+
+        # 'None' indicates that static analysis failed.
+        self._static_info = _static_command_info(entry_point)
+
+        if self._static_info is None:
+            name = self.load().name
+        else:
+            name = self._static_info[0]
+
+        super().__init__(name)
+
+        # Short help derived from '_static_info'. Keys are the 'limit' given
+        # to 'get_short_help_str()', and 'None' for 'short_help'.
+        self._short_help_cache = {}
+
+    def load(self):
+
+        """Load the entry point, or return the previously loaded command.
+
+        :rtype click.Command:
+        """
+
+        # Avoid acquiring the lock once the command has been loaded. The
+        # second check is required because another thread may have loaded
+        # the command while this thread was waiting on the lock.
+        command = self._command
+        if command is None:
+            with self._lock:
+                if self._command is None:
+                    try:
+                        self._command = self.entry_point.load()
+                    # See 'with_plugins()' for why all exceptions are caught.
+                    except Exception as e:
+                        self._command = BrokenCommand(self.entry_point, e)
+                command = self._command
+
+        return command
+
+    def static_info(self):
+
+        """Command information extracted without loading the entry point.
+
+        :rtype tuple or None:
+
+        :returns:
+            See ``_static_command_info()``. ``None`` if the command is already
+            loaded, or the information could not be extracted.
+        """
+
+        if self._command is not None:
+            return None
+
+        return self._static_info
+
+    # 'click.Command.__init__()' sets these attributes, but their values are
+    # always taken from the plugin. See '_delegated()'.
+
+    @property
+    def short_help(self):
+        info = self.static_info()
+        if info is None:
+            return self.load().short_help
+
+        # Depending on the version of 'click', this is either the argument
+        # given to the command, or derived from its help.
+        if None not in self._short_help_cache:
+            _, short_help, help_text = info
+            self._short_help_cache[None] = click.Command(
+                None, help=help_text, short_help=short_help).short_help
+
+        return self._short_help_cache[None]
+
+    @short_help.setter
+    def short_help(self, value):
+        pass
+
+    @property
+    def hidden(self):
+        # Static analysis fails for hidden commands.
+        if self.static_info() is None:
+            return self.load().hidden
+        return False
+
+    @hidden.setter
+    def hidden(self, value):
+        pass
+
+    callback = _delegated('callback')
+    context_settings = _delegated('context_settings')
+    params = _delegated('params')
+    help = _delegated('help')
+    epilog = _delegated('epilog')
+    options_metavar = _delegated('options_metavar')
+    add_help_option = _delegated('add_help_option')
+    no_args_is_help = _delegated('no_args_is_help')
+    deprecated = _delegated('deprecated')
+
+    def get_short_help_str(self, limit=45):
+
+        """Short help for the plugin.
+
+        :param int limit:
+            Maximum length of the short help.
+
+        :rtype str:
+        """
+
+        info = self.static_info()
+        if info is None:
+            return _get_short_help(self.load(), limit)
+
+        # Help is often rendered with the same limit, and building it
+        # requires a 'click.Command()'.
+        if limit not in self._short_help_cache:
+            self._short_help_cache[limit] = _short_help(info, limit)
+
+        return self._short_help_cache[limit]
+
+    def make_context(self, *args, **kwargs):
+
+        """Create a context for the loaded command.
+
+        ``click.Group()`` executes subcommands by calling this method and then
+        invoking the command attached to the new context, so after this point
+        ``click`` only interacts with the loaded command.
+
+        :rtype click.Context:
+        """
+
+        return self.load().make_context(*args, **kwargs)
+
+    def main(self, *args, **kwargs):
+
+        """Execute the loaded command as a standalone CLI."""
+
+        return self.load().main(*args, **kwargs)
+
+    def to_info_dict(self, ctx):
+
+        """Information about the loaded command.
+
+        :param click.Context ctx:
+            Active context.
+
+        :rtype dict:
+        """
+
+        return self.load().to_info_dict(ctx)
+
+    def invoke(self, ctx):
+
+        """Invoke the loaded command.
+
+        :param click.Context ctx:
+            Active context.
+        """
+
+        return self.load().invoke(ctx)
+
+    def parse_args(self, ctx, args):
+
+        """Parse arguments with the loaded command.
+
+        :param click.Context ctx:
+            Active context.
+        :param list args:
+            List of command line arguments.
+
+        :rtype list:
+        """
+
+        return self.load().parse_args(ctx, args)
+
+    def get_help(self, ctx):
+
+        """Help text for the loaded command.
+
+        :param click.Context ctx:
+            Active context.
+
+        :rtype str:
+        """
+
+        return self.load().get_help(ctx)
+
+    def get_usage(self, ctx):
+
+        """Usage for the loaded command.
+
+        :param click.Context ctx:
+            Active context.
+
+        :rtype str:
+        """
+
+        return self.load().get_usage(ctx)
+
+    def get_params(self, ctx):
+
+        """Parameters for the loaded command.
+
+        :param click.Context ctx:
+            Active context.
+
+        :rtype list:
+        """
+
+        return self.load().get_params(ctx)
+
+
+class PluginGroup(click.Group):
+
+    """A ``click.Group()`` with help text suited to many plugins.
+
+    Plugins attached with ``@with_plugins(lazy=True)`` are listed in one
+    section per distribution, and commands that could not be loaded are
+    marked with a short footnote instead of a full warning. Other commands
+    are listed in the usual ``Commands`` section. Help text is built without
+    loading plugins when possible. See ``LazyCommand()``.
+
+    >>> @with_plugins('group_name', lazy=True)
+    >>> @click.group(cls=PluginGroup)
+    >>> def group():
+    ...     '''Group'''
+    """
+
+    def format_commands(self, ctx, formatter):
+
+        """Write all commands, grouped by distribution, to the formatter.
+
+        :param click.Context ctx:
+            Active context.
+        :param click.HelpFormatter formatter:
+            Write to this formatter.
+        """
+
+        for _ in _write_plugin_help(self, ctx, formatter):
+            pass
+
+
+def iter_plugin_help(group, ctx, prefix=None):
+
+    """Produce help text for a group's commands one section at a time.
+
+    Similar to the commands section of ``$ cli --help`` for a
+    ``PluginGroup()``, but can be filtered, and is produced incrementally.
+    Suitable for ``click.echo_via_pager()`` when there are too many commands
+    to reasonably display at once.
+
+    >>> @group.command()
+    >>> @click.argument('prefix', required=False)
+    >>> @click.pass_context
+    >>> def plugins(ctx, prefix):
+    ...     '''List plugins.'''
+    ...     click.echo_via_pager(iter_plugin_help(group, ctx.parent, prefix))
+
+    :param click.Group group:
+        Produce help for this group's commands.
+    :param click.Context ctx:
+        Context for ``group``.
+    :param str or None prefix:
+        Only include commands whose name starts with this prefix.
+
+    :rtype generator:
+    """
+
+    formatter = ctx.make_formatter()
+
+    for _ in _write_plugin_help(group, ctx, formatter, prefix=prefix):
+        yield ''.join(formatter.buffer)
+        del formatter.buffer[:]
+
+
+def warm_plugins(group, names=None):
+
+    """Load a group's lazy plugins ahead of time.
+
+    Intended for applications executing commands in a pool of worker
+    processes. Loading plugins once in the parent process avoids having each
+    worker discover entry points again, and allows broken plugins to be
+    reported once instead of once per worker. With the ``fork`` start method,
+    workers inherit ``group`` with its plugins already loaded. With the
+    ``spawn`` start method, pass the returned manifest to the workers, and
+    give it to ``@with_plugins()`` instead of an entry point group name. The
+    manifest includes plugins that were not loaded, so workers have the same
+    commands as the parent, except for plugins that could not be loaded.
+
+    >>> @with_plugins('group_name', lazy=True)
+    >>> @click.group()
+    >>> def group():
+    ...     '''Group'''
+    >>>
+    >>> manifest, broken = warm_plugins(group)
+    >>> for cmd in broken:
+    ...     click.echo(cmd.help, err=True)
+    >>>
+    >>> # In each worker.
+    >>> @with_plugins(manifest, lazy=True)
+    >>> @click.group()
+    >>> def group():
+    ...     '''Group'''
+
+    Loading is thread-safe, but a process forked while another thread is
+    loading a plugin may deadlock. Call this function before starting
+    threads or worker processes.
+
+    :param click.Group group:
+        Load plugins attached to this group with ``lazy=True``.
+    :param sequence[str] or None names:
+        Only load the plugins registered with these command names. By
+        default all plugins are loaded. Does not affect the manifest.
+
+    :raises TypeError:
+        If plugins were attached to ``group`` without ``lazy=True``, or if
+        ``names`` is a single ``str``.
+
+    :rtype tuple:
+
+    :returns:
+        A ``tuple()`` of ``importlib.metadata.EntryPoint()`` objects, which
+        can be pickled, for all plugins except those that could not be
+        loaded, and a ``list()`` of ``BrokenCommand()`` objects for plugins
+        that could not be loaded.
+    """
+
+    # A 'str' is a sequence of characters, and would match command names by
+    # substring.
+    if isinstance(names, str):
+        raise TypeError(
+            f"'names' must be a sequence of command names, not a string:"
+            f" {names!r}")
+
+    # Plugins attached without 'lazy=True' do not have a 'LazyCommand()',
+    # and therefore no entry point to include in the manifest.
+    eager = sorted(
+        getattr(group, '_eager_plugins', set()).intersection(group.commands))
+    if eager:
+        raise TypeError(
+            f"plugins must be attached with '@with_plugins(lazy=True)':"
+            f" {', '.join(eager)}")
+
+    manifest = []
+    broken = []
+
+    for name, cmd in group.commands.items():
+
+        if not isinstance(cmd, LazyCommand):
+            continue
+
+        if names is None or name in names:
+            cmd.load()
+
+        # Plugins that could not be analyzed statically are loaded by
+        # '@with_plugins()', so they may be broken even if not selected.
+        if isinstance(cmd._command, BrokenCommand):
+            broken.append(cmd._command)
+        else:
+            manifest.append(cmd.entry_point)
+
+    return tuple(manifest), broken
+
+
+def _write_plugin_help(group, ctx, formatter, prefix=None):
+
+    """Write a group's commands to a formatter grouped by distribution.
+
+    Parameters
+    ----------
+    group : click.Group
+        Write this group's commands.
+    ctx : click.Context
+        Context for ``group``.
+    formatter : click.HelpFormatter
+        Write to this formatter.
+    prefix : str or None, optional
+        Only include commands whose name starts with this prefix.
+
+    Yields
+    ------
+    None
+        After each section is written to ``formatter``.
+    """
+
+    # A distribution's name is read from its metadata on every access, but
+    # its entry points all reference the same 'Distribution()'.
+    distributions = {}
+
+    sections = collections.defaultdict(list)
+    for name in group.list_commands(ctx):
+
+        if prefix is not None and not name.startswith(prefix):
+            continue
+
+        cmd = group.get_command(ctx, name)
+        if cmd is None or getattr(cmd, 'hidden', False):
+            continue
+
+        if isinstance(cmd, (BrokenCommand, LazyCommand)):
+            dist = getattr(cmd.entry_point, 'dist', None)
+            if dist is None:
+                title = 'Plugins'
+            else:
+                # 'Distribution.name' warns on some versions of Python if the
+                # metadata does not include a name.
+                if id(dist) not in distributions:
+                    distributions[id(dist)] = (
+                        dist.metadata.get('Name') or 'Plugins')
+                title = distributions[id(dist)]
+        else:
+            title = 'Commands'
+
+        sections[title].append((name, cmd))
+
+    titles = sorted(sections)
+    if 'Commands' in sections:
+        titles.remove('Commands')
+        titles.insert(0, 'Commands')
+
+    broken = False
+    for title in titles:
+
+        commands = sections[title]
+        limit = formatter.width - 6 - max(len(n) for n, _ in commands)
+
+        rows = []
+        for name, cmd in commands:
+
+            # Computing the short help may load a 'LazyCommand()'.
+            text = _get_short_help(cmd, limit)
+
+            if isinstance(cmd, LazyCommand):
+                cmd = cmd._command
+            if isinstance(cmd, BrokenCommand):
+                broken = True
+                text = '\u2020'
+
+            rows.append((name, text))
+
+        with formatter.section(title):
+            formatter.write_dl(rows)
+
+        yield
+
+    if broken:
+        formatter.write_paragraph()
+        formatter.write_text(
+            "\u2020 Could not load plugin. Invoke command with '--help' for"
+            " traceback.")
+        yield
+
+
+def _get_short_help(cmd, limit):
+
+    """Short help for any ``click.Command()``.
+
+    Parameters
+    ----------
+    cmd : click.Command
+        Get short help for this command.
+    limit : int
+        Maximum length of the short help.
+
+    Returns
+    -------
+    str
+    """
+
+    # 'click' v6 does not offer this method.
+    if hasattr(cmd, 'get_short_help_str'):
+        return cmd.get_short_help_str(limit)
+
+    return cmd.short_help or ''
+
+
+def _short_help(info, limit):
+
+    """Short help from ``_static_command_info()`` like ``click`` builds it.
+
+    Parameters
+    ----------
+    info : tuple
+        From ``_static_command_info()``.
+    limit : int
+        Maximum length of the short help.
+
+    Returns
+    -------
+    str
+    """
+
+    _, short_help, help_text = info
+
+    # Let 'click' build the short help. The rules vary across versions.
+    command = click.Command(None, help=help_text, short_help=short_help)
+
+    return _get_short_help(command, limit)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_command_info(module):
+
+    """Parse a module's source code and extract information about commands.
+
+    The module is not executed, however parent packages of a submodule are
+    imported in order to locate it. Only the extracted information is
+    cached, not the parsed source code. The cache is not bounded since help
+    text lists commands alphabetically, which interleaves modules and would
+    cause a bounded cache to parse modules repeatedly.
+
+    Parameters
+    ----------
+    module : str
+        Fully qualified module name.
+
+    Returns
+    -------
+    dict
+        Maps names of top-level functions to ``(name, short_help, help)``. See
+        ``_static_command_info()``. Functions whose name is bound more than
+        once anywhere in the module, or whose attributes are modified, are
+        excluded since static analysis cannot determine what object the name
+        refers to when the module is loaded. Empty if the source code could
+        not be found or parsed.
+    """
+
+    # Reading bytes allows 'ast.parse()' to honor PEP 263 source encoding
+    # declarations.
+    try:
+        spec = importlib.util.find_spec(module)
+        with open(spec.origin, 'rb') as f:
+            tree = ast.parse(f.read(), filename=spec.origin)
+    except Exception:
+        return {}
+
+    bound = collections.Counter()
+    modified = set()
+
+    for node in ast.walk(tree):
+
+        if isinstance(
+                node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound[node.name] += 1
+
+        elif isinstance(node, ast.alias):
+
+            # A '*' import could bind any name.
+            if node.name == '*':
+                return {}
+            bound[(node.asname or node.name).split('.')[0]] += 1
+
+        elif isinstance(node, ast.Name):
+            if not isinstance(node.ctx, ast.Load):
+                bound[node.id] += 1
+
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            modified.update(node.names)
+
+        # Names bound by 'except ... as name:' and 'match' patterns.
+        elif isinstance(getattr(node, 'name', None), str):
+            bound[node.name] += 1
+
+        elif isinstance(node, ast.Attribute):
+            if not isinstance(node.ctx, ast.Load) \
+                    and isinstance(node.value, ast.Name):
+                modified.add(node.value.id)
+
+        elif isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name) \
+                    and node.func.id in ('setattr', 'delattr') \
+                    and node.args and isinstance(node.args[0], ast.Name):
+                modified.add(node.args[0].id)
+
+    info = {}
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) \
+                and bound[node.name] == 1 and node.name not in modified:
+            info[node.name] = _command_info(node)
+
+    return info
+
+
+def _command_info(node):
+
+    """Extract command information from a function's source code.
+
+    Parameters
+    ----------
+    node : ast.FunctionDef
+        Inspect this function's decorators and docstring.
+
+    Returns
+    -------
+    tuple or None
+        See ``_static_command_info()``.
+    """
+
+    decorators = []
+    for decorator in node.decorator_list:
+        func = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if isinstance(func, ast.Attribute):
+            func_name = func.attr
+        elif isinstance(func, ast.Name):
+            func_name = func.id
+        else:
+            continue
+        if func_name in ('command', 'group'):
+            decorators.append((func_name, decorator))
+
+    # The command decorator must be outermost, otherwise another decorator
+    # may wrap or modify the command.
+    if len(decorators) != 1 or decorators[0][1] is not node.decorator_list[0]:
+        return None
+    decorator_name, decorator = decorators[0]
+
+    args = decorator.args if isinstance(decorator, ast.Call) else []
+    keywords = decorator.keywords if isinstance(decorator, ast.Call) else []
+
+    kwargs = {}
+    for keyword in keywords:
+        if keyword.arg is None or not isinstance(keyword.value, ast.Constant):
+            return None
+        kwargs[keyword.arg] = keyword.value.value
+
+    if kwargs.pop('hidden', False) or kwargs.pop('deprecated', False):
+        return None
+    if 'cls' in kwargs:
+        return None
+
+    if len(args) > 1:
+        return None
+    elif args:
+        if not isinstance(args[0], ast.Constant) or 'name' in kwargs:
+            return None
+        kwargs['name'] = args[0].value
+
+    for key in ('name', 'short_help', 'help'):
+        if not isinstance(kwargs.get(key, ''), (str, type(None))):
+            return None
+
+    name = kwargs.get('name')
+    if name is None:
+
+        # Let 'click' derive the name from the function. The rules vary
+        # across versions.
+        def function():
+            pass
+        function.__name__ = node.name
+        name = getattr(click, decorator_name)()(function).name
+
+    help_text = kwargs.get('help')
+    if help_text is None:
+        help_text = ast.get_docstring(node)
+
+    return name, kwargs.get('short_help'), help_text
+
+
+def _static_command_info(ep):
+
+    """Extract command information from a plugin without executing it.
+
+    Finds the function referenced by the entry point in the plugin's source
+    code, and inspects its ``@click.command()`` or ``@click.group()``
+    decorator and docstring. Only simple and common plugin definitions are
+    supported. Anything that could cause
+    the loaded command to differ from what is found in the source code causes
+    this function to give up. This includes hidden and deprecated commands, a
+    custom ``cls``, arguments that are not literals, names that are bound
+    more than once, and modifying the command's attributes.
+
+    Parameters
+    ----------
+    ep : importlib.metadata.EntryPoint
+        Inspect the plugin referenced by this entry point.
+
+    Returns
+    -------
+    tuple or None
+        ``(name, short_help, help)`` where ``name`` is the command's name as
+        ``click`` would derive it, and ``short_help`` and ``help`` are the
+        corresponding arguments for ``click.Command()``. Either may be
+        ``None``. ``None`` if the
+        information cannot be determined statically, in which case the entry
+        point must be loaded.
+    """
+
+    attr = _attr(ep)
+    if not attr or '.' in attr:
+        return None
+
+    return _module_command_info(_module(ep)).get(attr)
+
+
+def _entry_points_from_path(group, path):
+
+    """Entry points for a group provided by distributions in specific paths.
+
+    Similar to ``importlib.metadata.entry_points(group=...)``, but only
+    searches the given directories instead of every entry in ``sys.path``.
+    Like ``entry_points()``, when multiple directories contain a distribution
+    with the same name, only the first is used.
+
+    Parameters
+    ----------
+    group : str
+        Entry point group name.
+    path : sequence[str or os.PathLike]
+        Directories to search for installed distributions.
+
+    Returns
+    -------
+    list[importlib.metadata.EntryPoint]
+    """
+
+    seen = set()
+    all_entry_points = []
+
+    path = [os.fspath(p) for p in path]
+
+    for dist in importlib.metadata.distributions(path=path):
+
+        # Normalize according to PEP 503. Not all versions of Python offer a
+        # public property for this. Distributions without a name cannot be
+        # deduplicated.
+        name = dist.metadata.get('Name')
+        if name:
+            name = re.sub(r'[-_.]+', '-', name).lower()
+            if name in seen:
+                continue
+            seen.add(name)
+
+        all_entry_points.extend(
+            ep for ep in dist.entry_points if ep.group == group)
+
+    return all_entry_points
+
+
 def _module(ep):
 
     """Module name for a given entry point.
@@ -245,3 +1092,28 @@ def _module(ep):
         module = match.group('module')
 
     return module
+
+
+def _attr(ep):
+
+    """Attribute name for a given entry point.
+
+    Parameters
+    ----------
+    ep : importlib.metadata.EntryPoint
+        Determine the referenced attribute for this entry point.
+
+    Returns
+    -------
+    str or None
+    """
+
+    if sys.version_info >= (3, 10):
+        attr = ep.attr
+
+    else:
+        # From 'importlib.metadata.EntryPoint.attr'.
+        match = ep.pattern.match(ep.value)
+        attr = match.group('attr')
+
+    return attr
@@ -0,0 +1,235 @@
+# This file is part of 'click-plugins': https://github.com/click-contrib/click-plugins
+#
+# New BSD License
+#
+# Copyright (c) 2015-2026, Kevin D. Wurster, Sean C. Gillies
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""Benchmarks for rendering help for groups with many plugins.
+
+Compares ``$ cli --help`` for a ``click.Group()`` with eagerly loaded plugins
+against a ``PluginGroup()`` with lazily loaded plugins, and
+``iter_plugin_help()`` filtered by prefix. The cost of rendering alone is
+measured by rendering the same commands with both a ``click.Group()`` and a
+``PluginGroup()``.
+
+.. code-block:: console
+
+    $ python click_plugins_benchmarks.py
+"""
+
+
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+import click
+from click.testing import CliRunner
+
+import click_plugins
+from click_plugins import (
+    PluginGroup, iter_plugin_help, warm_plugins, with_plugins)
+
+
+# Number of plugins in each module and distribution. Real installations with
+# many plugins spread them across many modules and distributions.
+PLUGINS_PER_MODULE = 10
+PLUGINS_PER_DISTRIBUTION = 100
+
+# Each benchmark writes new modules, so plugins are not already imported.
+_benchmark_counter = itertools.count()
+
+
+def write_plugins(directory, count):
+
+    """Write modules with plugins, and distributions with entry points.
+
+    :param str directory:
+        Write to this directory.
+    :param int count:
+        Number of plugins.
+
+    :rtype str:
+
+    :returns:
+        Entry point group name.
+    """
+
+    prefix = f'click_plugins_benchmark_{next(_benchmark_counter)}'
+    group = f'{prefix}.plugins'
+
+    for start in range(0, count, PLUGINS_PER_MODULE):
+        module = f'{prefix}_{start // PLUGINS_PER_MODULE}'
+        stop = min(start + PLUGINS_PER_MODULE, count)
+        with open(os.path.join(directory, f'{module}.py'), 'w') as f:
+            f.write('import click\n')
+            for i in range(start, stop):
+                f.write(
+                    f'\n\n@click.command()\n'
+                    f'@click.argument("arg")\n'
+                    f'def cmd{i}(arg):\n'
+                    f'    """Benchmark command {i}."""\n')
+
+    for start in range(0, count, PLUGINS_PER_DISTRIBUTION):
+        name = f'{prefix}_dist{start // PLUGINS_PER_DISTRIBUTION}'
+        dist_info = os.path.join(directory, f'{name}-1.0.dist-info')
+        os.mkdir(dist_info)
+        with open(os.path.join(dist_info, 'METADATA'), 'w') as f:
+            f.write(f'Metadata-Version: 2.1\nName: {name}\n')
+        with open(os.path.join(dist_info, 'entry_points.txt'), 'w') as f:
+            f.write(f'[{group}]\n')
+            stop = min(start + PLUGINS_PER_DISTRIBUTION, count)
+            for i in range(start, stop):
+                module = f'{prefix}_{i // PLUGINS_PER_MODULE}'
+                f.write(f'cmd{i} = {module}:cmd{i}\n')
+
+    return group
+
+
+def timed(func):
+
+    """Execute a function and measure its duration in seconds.
+
+    :param callable func:
+        Execute this function without arguments.
+
+    :rtype tuple:
+
+    :returns:
+        Duration and the function's return value.
+    """
+
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+
+def benchmark(directory, count):
+
+    """Benchmark help rendering for a number of plugins.
+
+    :param str directory:
+        Temporary directory on ``sys.path``.
+    :param int count:
+        Number of plugins.
+
+    :rtype list:
+
+    :returns:
+        Benchmark names and durations in seconds.
+    """
+
+    runner = CliRunner()
+    results = []
+
+    # 'click.Group()' with plugins loaded when decorated.
+    group_name = write_plugins(directory, count)
+
+    def eager():
+        @with_plugins(group_name, path=[directory])
+        @click.group()
+        def cli():
+            """Eager."""
+        return cli
+
+    duration, cli = timed(eager)
+    results.append(('eager: load', duration))
+
+    duration, result = timed(lambda: runner.invoke(cli, ['--help']))
+    assert result.exit_code == 0, result.output
+    results.append(('eager: --help', duration))
+
+    # 'PluginGroup()' with plugins loaded on demand.
+    group_name = write_plugins(directory, count)
+
+    def lazy():
+        @with_plugins(group_name, path=[directory], lazy=True)
+        @click.group(cls=PluginGroup)
+        def cli():
+            """Lazy."""
+        return cli
+
+    duration, cli = timed(lazy)
+    results.append(('lazy: load', duration))
+
+    duration, result = timed(lambda: runner.invoke(cli, ['--help']))
+    assert result.exit_code == 0, result.output
+    results.append(('lazy: --help', duration))
+
+    duration, result = timed(lambda: runner.invoke(cli, ['--help']))
+    results.append(('lazy: --help (again)', duration))
+
+    ctx = click.Context(cli, info_name='cli')
+    duration, _ = timed(lambda: list(iter_plugin_help(cli, ctx, 'cmd1')))
+    results.append(("lazy: iter_plugin_help(prefix='cmd1')", duration))
+
+    loaded = sum(
+        cmd._command is not None for cmd in cli.commands.values())
+    assert loaded == 0, f'{loaded} plugins were loaded'
+
+    # Rendering alone. Both group classes render the same commands, first
+    # with short help from static analysis, and then with all plugins loaded.
+    for label in ('static', 'loaded'):
+
+        if label == 'loaded':
+            warm_plugins(cli)
+
+        for cls in (click.Group, PluginGroup):
+            group = cls('cli', commands=cli.commands)
+            duration, result = timed(
+                lambda: runner.invoke(group, ['--help']))
+            assert result.exit_code == 0, result.output
+            results.append((f'render {label}: {cls.__name__}', duration))
+
+    return results
+
+
+def main():
+
+    """Run benchmarks and print results."""
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        sys.path.insert(0, directory)
+
+        try:
+            for count in (1000, 10000):
+                print(f'{count} plugins:')
+                for name, duration in benchmark(directory, count):
+                    print(f'  {name:<40} {duration:>8.3f}s')
+                click_plugins._module_command_info.cache_clear()
+
+        finally:
+            sys.path.remove(directory)
+
+
+if __name__ == '__main__':
+    main()
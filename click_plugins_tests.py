@@ -34,20 +34,30 @@
 """Tests for ``click_plugins``."""
 
 
-from collections import defaultdict
+from collections import Counter, defaultdict
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import configparser
 import importlib.metadata
 from io import StringIO
 import importlib.metadata
+import multiprocessing
 import os
+import pathlib
+import pickle
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from unittest import mock
 
 import click
 from click.testing import CliRunner
 
-from click_plugins import _module, with_plugins
+from click_plugins import (
+    BrokenCommand, LazyCommand, PluginGroup, _get_short_help, _module,
+    _static_command_info, iter_plugin_help, warm_plugins, with_plugins)
 
 
 ###############################################################################
@@ -126,6 +136,25 @@ def cmd2(arg):
     click.echo('passed')
 
 
+@click.command('cmd-3', short_help='Short help for command 3')
+@click.argument('arg')
+def cmd3(arg):
+    """Test command 3"""
+    click.echo('passed')
+
+
+@click.command()
+@click.argument('arg')
+def cmd_return(arg):
+    """Test command returning its argument"""
+    return arg
+
+
+@click.command(cls=click.Command)
+def cmd_cls():
+    """Test command with a custom class"""
+
+
 ###############################################################################
 # Shim Entry Point Machinery
 
@@ -208,6 +237,113 @@ class VirtualDistribution(importlib.metadata.Distribution):
         return text.strip()
 
 
+class SlowEntryPoint(importlib.metadata.EntryPoint):
+
+    """An entry point that is slow to load, and counts how often it loads.
+
+    Simulates a plugin with an expensive import, which widens the window for
+    threads to race while loading.
+    """
+
+    load_counts = Counter()
+    load_counts_lock = threading.Lock()
+
+    def load(self):
+        with self.load_counts_lock:
+            self.load_counts[self.name] += 1
+        time.sleep(0.05)
+        return super().load()
+
+
+def write_distribution(directory, name, entry_points, metadata_name=True):
+
+    """Write an installed distribution's metadata to a directory.
+
+    :param str directory:
+        Write ``.dist-info`` directory here.
+    :param str name:
+        Distribution name.
+    :param dict entry_points:
+        Entry points in the ``click_plugins_tests.path`` group.
+    :param bool metadata_name:
+        Include the name in the distribution's metadata.
+    """
+
+    dist_info = os.path.join(directory, f'{name}-1.0.dist-info')
+    os.mkdir(dist_info)
+    with open(os.path.join(dist_info, 'METADATA'), 'w') as f:
+        f.write('Metadata-Version: 2.1')
+        if metadata_name:
+            f.write(f'{os.linesep}Name: {name}')
+    cfg = configparser.ConfigParser()
+    cfg['click_plugins_tests.path'] = entry_points
+    with open(os.path.join(dist_info, 'entry_points.txt'), 'w') as f:
+        cfg.write(f)
+
+
+def run_from_manifest(manifest, args):
+
+    """Execute a CLI built from a plugin manifest in a worker process.
+
+    Entry point discovery is disabled to ensure the manifest is sufficient.
+
+    :param tuple manifest:
+        From ``warm_plugins()``.
+    :param list args:
+        Arguments for the CLI.
+
+    :rtype tuple:
+
+    :returns:
+        Exit code and output.
+    """
+
+    with mock.patch(
+            'importlib.metadata.entry_points', side_effect=AssertionError):
+
+        @with_plugins(manifest, lazy=True)
+        @click.group()
+        def group():
+            """run_from_manifest"""
+
+        result = CliRunner().invoke(group, args)
+
+    return result.exit_code, result.output
+
+
+def write_plugin_module(directory, module, count, broken=False):
+
+    """Write a module containing plugins.
+
+    :param str directory:
+        Write module here.
+    :param str module:
+        Module name.
+    :param int count:
+        Number of plugins. Commands are named ``cmd0``, ``cmd1``, etc., or
+        ``broken0``, ``broken1``, etc.
+    :param bool broken:
+        Raise an exception when the module is imported. The plugins can still
+        be statically analyzed.
+    """
+
+    prefix = 'broken' if broken else 'cmd'
+
+    with open(os.path.join(directory, f'{module}.py'), 'w') as f:
+        f.write('import click\n')
+        for i in range(count):
+            f.write(
+                f'\n\n@click.command()\n'
+                f'@click.argument("arg")\n'
+                f'def {prefix}{i}(arg):\n'
+                f'    """Generated command {i}"""\n'
+                f'    return arg\n')
+        if broken:
+            f.write('\n\nraise RuntimeError("broken plugin")\n')
+
+    importlib.invalidate_caches()
+
+
 ###############################################################################
 # Tests
 
@@ -342,6 +478,694 @@ class TestLoad(unittest.TestCase):
 
             self.assertEqual(expected_keys, tuple(group.commands.keys()))
 
+    def test_entry_point_group_name_path(self):
+
+        """Load plugins from an entry points group name in specific paths."""
+
+        with tempfile.TemporaryDirectory() as included, \
+                tempfile.TemporaryDirectory() as shadowed, \
+                tempfile.TemporaryDirectory() as excluded:
+
+            write_distribution(included, 'included', {
+                'cmd1': 'click_plugins_tests:cmd1',
+                EP_NO_EXIST_KEY: EP_NO_EXIST_VALUE})
+
+            # Same distribution name as above, so it should be ignored.
+            write_distribution(shadowed, 'included', {
+                'cmd2': 'click_plugins_tests:cmd2'})
+
+            # Not in 'path' at all.
+            write_distribution(excluded, 'excluded', {
+                'cmd2': 'click_plugins_tests:cmd2'})
+
+            @with_plugins(
+                'click_plugins_tests.path',
+                path=[included, pathlib.Path(shadowed)])
+            @click.group()
+            def group():
+                """test_entry_point_group_name_path"""
+
+        self.assertEqual(
+            sorted(group.commands.keys()), ['cmd1', EP_NO_EXIST_KEY])
+        self.assertIsInstance(
+            group.commands[EP_NO_EXIST_KEY], BrokenCommand)
+
+    def test_entry_point_group_name_path_no_name(self):
+
+        """Distributions without a name in their metadata are loaded."""
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            write_distribution(directory, 'unnamed1', {
+                'cmd1': 'click_plugins_tests:cmd1'}, metadata_name=False)
+            write_distribution(directory, 'unnamed2', {
+                'cmd2': 'click_plugins_tests:cmd2'}, metadata_name=False)
+
+            @with_plugins('click_plugins_tests.path', path=[directory])
+            @click.group()
+            def group():
+                """test_entry_point_group_name_path_no_name"""
+
+        self.assertEqual(sorted(group.commands.keys()), ['cmd1', 'cmd2'])
+
+    def test_path_requires_group_name(self):
+
+        """``path`` cannot be combined with ``EntryPoint()`` objects."""
+
+        entry_points = mock_entry_points_from_group(
+            'click_plugins_tests.valid')
+
+        with self.assertRaises(ValueError) as e:
+            with_plugins(entry_points, path=[os.getcwd()])
+
+        self.assertIn("'path'", str(e.exception))
+
+        with self.assertRaises(TypeError) as e:
+            with_plugins('click_plugins_tests.path', path=os.getcwd())
+
+        self.assertIn("'path'", str(e.exception))
+
+        with self.assertRaises(TypeError) as e:
+            with_plugins(
+                'click_plugins_tests.path', path=pathlib.Path(os.getcwd()))
+
+        self.assertIn("'path'", str(e.exception))
+
+
+class TestLazy(unittest.TestCase):
+
+    """Plugins loaded on demand."""
+
+    def setUp(self):
+        self.runner = CliRunner()
+        SlowEntryPoint.load_counts.clear()
+
+    def test_not_loaded(self):
+
+        """Registering lazy plugins only loads those that cannot be analyzed.
+        """
+
+        entry_points = [
+            SlowEntryPoint('cmd1', 'click_plugins_tests:cmd1', 'lazy'),
+            SlowEntryPoint(EP_NO_EXIST_KEY, EP_NO_EXIST_VALUE, 'lazy')]
+
+        @with_plugins(entry_points, lazy=True)
+        @click.group()
+        def group():
+            """test_not_loaded"""
+
+        self.assertEqual(
+            sorted(group.commands.keys()), ['cmd1', EP_NO_EXIST_KEY])
+        for cmd in group.commands.values():
+            self.assertIsInstance(cmd, LazyCommand)
+
+        # The entry point that does not exist is loaded to determine its
+        # name.
+        self.assertEqual({EP_NO_EXIST_KEY: 1}, SlowEntryPoint.load_counts)
+
+        result = self.runner.invoke(group, ['cmd1', 'something'])
+        self.assertEqual(0, result.exit_code)
+        self.assertEqual(f'passed{os.linesep}', result.output)
+        self.assertEqual(
+            {'cmd1': 1, EP_NO_EXIST_KEY: 1}, SlowEntryPoint.load_counts)
+
+        result = self.runner.invoke(group, [EP_NO_EXIST_KEY])
+        self.assertEqual(1, result.exit_code)
+        self.assertIn('Traceback', result.output)
+
+        result = self.runner.invoke(group, ['--help'])
+        self.assertEqual(0, result.exit_code)
+        self.assertIn('Test command 1', result.output)
+        self.assertIn('\u2020 Warning:', result.output)
+
+    def test_names(self):
+
+        """Lazy plugins have the same names as when loaded eagerly."""
+
+        entry_points = [
+            importlib.metadata.EntryPoint(
+                'ep_cmd3', 'click_plugins_tests:cmd3', 'lazy'),
+            importlib.metadata.EntryPoint(
+                'ep_cmd_return', 'click_plugins_tests:cmd_return', 'lazy'),
+            importlib.metadata.EntryPoint(
+                'ep_cmd_cls', 'click_plugins_tests:cmd_cls', 'lazy'),
+            importlib.metadata.EntryPoint(
+                EP_NO_EXIST_KEY, EP_NO_EXIST_VALUE, 'lazy')]
+
+        @with_plugins(entry_points)
+        @click.group()
+        def eager():
+            """Eager."""
+
+        @with_plugins(entry_points, lazy=True)
+        @click.group()
+        def lazy():
+            """Lazy."""
+
+        self.assertEqual(
+            sorted(eager.commands.keys()), sorted(lazy.commands.keys()))
+        self.assertIn('cmd-3', lazy.commands)
+        self.assertIn(cmd_return.name, lazy.commands)
+
+        # Only plugins that cannot be analyzed are loaded.
+        loaded = sorted(
+            name for name, cmd in lazy.commands.items()
+            if cmd._command is not None)
+        self.assertEqual(sorted([cmd_cls.name, EP_NO_EXIST_KEY]), loaded)
+
+    def test_delegated(self):
+
+        """A lazy plugin behaves like the command it references."""
+
+        entry_points = [
+            SlowEntryPoint('cmd-3', 'click_plugins_tests:cmd3', 'lazy')]
+
+        @with_plugins(entry_points, lazy=True)
+        @click.group()
+        def group():
+            """test_delegated"""
+
+        @group.command()
+        @click.argument('arg')
+        @click.pass_context
+        def caller(ctx, arg):
+            """Invoke the plugin from another command."""
+            plugin = group.get_command(ctx, 'cmd-3')
+            ctx.invoke(plugin, arg=arg)
+            ctx.forward(plugin)
+
+        self.assertEqual({}, SlowEntryPoint.load_counts)
+
+        result = self.runner.invoke(group, ['caller', 'something'])
+        self.assertEqual(0, result.exit_code)
+        self.assertEqual(f'passed{os.linesep}' * 2, result.output)
+
+        plugin = group.commands['cmd-3']
+        self.assertIs(cmd3.callback, plugin.callback)
+        self.assertEqual(['arg'], [p.name for p in plugin.params])
+        self.assertEqual(cmd3.help, plugin.help)
+
+        ctx = click.Context(plugin, info_name='cmd-3')
+        self.assertIn(cmd3.help, plugin.get_help(ctx))
+        self.assertEqual({'cmd-3': 1}, SlowEntryPoint.load_counts)
+
+    def test_static_command_info(self):
+
+        """Extract command information without loading the plugin."""
+
+        mapping = {
+            'cmd1': (cmd1.name, None, cmd1.help),
+            'cmd3': ('cmd-3', 'Short help for command 3', cmd3.help),
+            'cmd_cls': None,
+            '__no__exist__': None,
+        }
+
+        for attr, expected in mapping.items():
+            ep = importlib.metadata.EntryPoint(
+                attr, f'click_plugins_tests:{attr}', 'static')
+            self.assertEqual(expected, _static_command_info(ep))
+
+        ep = importlib.metadata.EntryPoint(
+            'no_module', 'click_plugins_tests_no_exist:cmd', 'static')
+        self.assertIsNone(_static_command_info(ep))
+
+    def test_static_command_info_source(self):
+
+        """Static analysis gives up when the source is ambiguous."""
+
+        command = (
+            '@click.command()\n'
+            'def cmd():\n'
+            '    """Docstring help"""\n')
+
+        mapping = {
+            'simple': command,
+            'attribute': f'{command}\ncmd.short_help = "Modified help"\n',
+            'nested_def': (
+                f'{command}\n'
+                f'try:\n'
+                f'    pass\n'
+                f'except ImportError:\n'
+                f'    @click.command()\n'
+                f'    def cmd():\n'
+                f'        """Fallback help"""\n'),
+            'nested_import': (
+                f'{command}\n'
+                f'try:\n'
+                f'    from click_plugins_tests import cmd3 as cmd\n'
+                f'except ImportError:\n'
+                f'    pass\n'),
+            'global': (
+                f'{command}\n'
+                f'def rebind():\n'
+                f'    global cmd\n'),
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            sys.path.insert(0, directory)
+            self.addCleanup(sys.path.remove, directory)
+
+            for name, body in mapping.items():
+
+                module = f'click_plugins_tests_static_{name}'
+                with open(os.path.join(directory, f'{module}.py'), 'w') as f:
+                    f.write(f'import click\n\n\n{body}')
+                importlib.invalidate_caches()
+
+                ep = importlib.metadata.EntryPoint(
+                    'cmd', f'{module}:cmd', 'static')
+
+                with self.subTest(name=name):
+
+                    if name == 'simple':
+                        self.assertEqual(
+                            ('cmd', None, 'Docstring help'),
+                            _static_command_info(ep))
+                    else:
+                        self.assertIsNone(_static_command_info(ep))
+
+                    # Help is the same before and after loading.
+                    lazy = LazyCommand(ep)
+                    before = (lazy.short_help, _get_short_help(lazy, 45))
+                    loaded = lazy.load()
+                    self.assertEqual(
+                        before,
+                        (loaded.short_help, _get_short_help(loaded, 45)))
+                    self.assertEqual(
+                        before, (lazy.short_help, _get_short_help(lazy, 45)))
+
+            # Source encoding declared with PEP 263.
+            module = 'click_plugins_tests_static_encoding'
+            with open(os.path.join(directory, f'{module}.py'), 'wb') as f:
+                f.write(
+                    '# -*- coding: latin-1 -*-\n'
+                    'import click\n\n\n'
+                    '@click.command()\n'
+                    'def cmd():\n'
+                    '    """Caf\u00e9"""\n'.encode('latin-1'))
+            importlib.invalidate_caches()
+
+            ep = importlib.metadata.EntryPoint(
+                'cmd', f'{module}:cmd', 'static')
+            self.assertEqual(
+                ('cmd', None, 'Caf\u00e9'), _static_command_info(ep))
+
+    def test_help_not_loaded(self):
+
+        """Rendering help does not load plugins if it can be avoided."""
+
+        entry_points = [
+            SlowEntryPoint('cmd1', 'click_plugins_tests:cmd1', 'lazy'),
+            SlowEntryPoint('cmd3', 'click_plugins_tests:cmd3', 'lazy'),
+            SlowEntryPoint('cls', 'click_plugins_tests:cmd_cls', 'lazy')]
+
+        @with_plugins(entry_points, lazy=True)
+        @click.group()
+        def group():
+            """test_help_not_loaded"""
+
+        result = self.runner.invoke(group, ['--help'])
+        self.assertEqual(0, result.exit_code)
+        self.assertIn('Test command 1', result.output)
+        self.assertIn('Short help for command 3', result.output)
+        self.assertIn('Test command with a custom class', result.output)
+
+        # Static analysis does not support a custom 'cls', so that plugin
+        # must be loaded.
+        self.assertEqual({'cls': 1}, SlowEntryPoint.load_counts)
+
+        # Help for the command itself requires loading.
+        result = self.runner.invoke(group, ['cmd-3', '--help'])
+        self.assertEqual(0, result.exit_code)
+        self.assertIn('Test command 3', result.output)
+        self.assertEqual(
+            {'cls': 1, 'cmd3': 1}, SlowEntryPoint.load_counts)
+
+    def plugin_entry_points(self, module, count):
+
+        """Slow entry points for generated valid and broken plugins.
+
+        :param str module:
+            Prefix for generated module names.
+        :param int count:
+            Number of valid and broken plugins.
+
+        :rtype list:
+        """
+
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        sys.path.insert(0, tmpdir.name)
+        self.addCleanup(sys.path.remove, tmpdir.name)
+
+        write_plugin_module(tmpdir.name, module, count)
+        write_plugin_module(tmpdir.name, f'{module}_broken', count, True)
+
+        entry_points = [
+            SlowEntryPoint(f'cmd{i}', f'{module}:cmd{i}', 'lazy')
+            for i in range(count)]
+        entry_points += [
+            SlowEntryPoint(f'broken{i}', f'{module}_broken:broken{i}', 'lazy')
+            for i in range(count)]
+
+        return entry_points
+
+    def test_threads(self):
+
+        """Concurrent first use loads each plugin exactly once."""
+
+        entry_points = self.plugin_entry_points(
+            'click_plugins_tests_threads', 10)
+        names = [ep.name for ep in entry_points]
+
+        @with_plugins(entry_points, lazy=True)
+        @click.group()
+        def group():
+            """test_threads"""
+
+        # Static analysis succeeds for all plugins, so none are loaded.
+        self.assertEqual({}, SlowEntryPoint.load_counts)
+
+        n_threads = 32
+        barrier = threading.Barrier(n_threads)
+
+        def worker(_):
+            barrier.wait()
+            ctx = click.Context(group)
+            return [
+                (n, group.get_command(ctx, n).load(),
+                 group.get_command(ctx, n).short_help)
+                for n in names]
+
+        with ThreadPoolExecutor(n_threads) as pool:
+            results = list(pool.map(worker, range(n_threads)))
+
+        # Every entry point was loaded once, and no commands were added or
+        # replaced on the group.
+        self.assertEqual(
+            {ep.name: 1 for ep in entry_points}, SlowEntryPoint.load_counts)
+        self.assertEqual(sorted(names), sorted(group.commands.keys()))
+
+        # Every thread received the identical command object.
+        for name, command, short_help in results[0]:
+            if name.startswith('broken'):
+                self.assertIsInstance(command, BrokenCommand)
+            else:
+                self.assertNotIsInstance(command, BrokenCommand)
+            self.assertEqual(name, command.name)
+        for other in results[1:]:
+            for (n1, c1, h1), (n2, c2, h2) in zip(results[0], other):
+                self.assertEqual(n1, n2)
+                self.assertIs(c1, c2)
+                self.assertEqual(h1, h2)
+
+    def test_threads_dispatch(self):
+
+        """Concurrent first execution through the group loads plugins once."""
+
+        entry_points = self.plugin_entry_points(
+            'click_plugins_tests_threads_dispatch', 10)
+
+        @with_plugins(entry_points, lazy=True)
+        @click.group()
+        def group():
+            """test_threads_dispatch"""
+
+        self.assertEqual({}, SlowEntryPoint.load_counts)
+
+        n_threads = 32
+        barrier = threading.Barrier(n_threads)
+
+        def run(args):
+            # Depending on the version of 'click', a command exiting with an
+            # error either returns the exit code, or raises 'SystemExit()'.
+            try:
+                return group.main(
+                    args, prog_name='group', standalone_mode=False)
+            except SystemExit as e:
+                return e.code
+
+        def worker(thread):
+            barrier.wait()
+            return [run([ep.name, str(thread)]) for ep in entry_points]
+
+        # Broken plugins print a traceback when executed.
+        with contextlib.redirect_stderr(StringIO()) as stderr, \
+                ThreadPoolExecutor(n_threads) as pool:
+            results = list(pool.map(worker, range(n_threads)))
+
+        self.assertEqual(
+            {ep.name: 1 for ep in entry_points}, SlowEntryPoint.load_counts)
+        self.assertEqual(
+            sorted(ep.name for ep in entry_points),
+            sorted(group.commands.keys()))
+        self.assertEqual(
+            n_threads * 10, stderr.getvalue().count('could not be loaded'))
+
+        for thread, values in enumerate(results):
+            self.assertEqual([str(thread)] * 10 + [1] * 10, values)
+
+        # All threads executed the same command objects.
+        ctx = click.Context(group)
+        for ep in entry_points:
+            cmd = group.get_command(ctx, ep.name).load()
+            if ep.name.startswith('broken'):
+                self.assertIsInstance(cmd, BrokenCommand)
+            else:
+                self.assertEqual(ep.name, cmd.name)
+
+
+class TestPluginHelp(unittest.TestCase):
+
+    """Help text for groups with many plugins."""
+
+    def setUp(self):
+
+        self.runner = CliRunner()
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        write_distribution(self.tmpdir.name, 'alpha', {
+            'cmd1': 'click_plugins_tests:cmd1',
+            EP_NO_EXIST_KEY: EP_NO_EXIST_VALUE})
+        write_distribution(self.tmpdir.name, 'beta', {
+            'cmd3': 'click_plugins_tests:cmd3'})
+
+        @with_plugins(
+            'click_plugins_tests.path', path=[self.tmpdir.name], lazy=True)
+        @click.group(cls=PluginGroup)
+        def group():
+            """Group with plugins."""
+
+        @group.command()
+        def local():
+            """Not a plugin."""
+
+        self.group = group
+
+        # Entry points only know their distribution on newer versions of
+        # Python. Otherwise all plugins are in a single section.
+        if sys.version_info >= (3, 10):
+            self.titles = ['alpha', 'beta']
+        else:
+            self.titles = ['Plugins']
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_help(self):
+
+        """Commands are grouped by distribution."""
+
+        result = self.runner.invoke(self.group, ['--help'])
+        self.assertEqual(0, result.exit_code)
+
+        output = result.output
+        sections = [output.index('Commands:')]
+        sections += [output.index(f'{t}:') for t in self.titles]
+        self.assertEqual(sorted(sections), sections)
+        self.assertLess(sections[0], output.index('local'))
+        self.assertLess(sections[1], output.index('cmd1'))
+        self.assertLess(sections[-1], output.index('cmd-3'))
+
+        # Broken plugins get a compact marker and a single footnote.
+        self.assertNotIn('\u2020 Warning:', output)
+        self.assertEqual(2, output.count('\u2020'))
+        self.assertIn('\u2020 Could not load plugin.', output)
+
+        result = self.runner.invoke(self.group, [EP_NO_EXIST_KEY])
+        self.assertEqual(1, result.exit_code)
+        self.assertIn('Traceback', result.output)
+
+    def test_help_no_name(self):
+
+        """Plugins from a distribution without a name are listed."""
+
+        with tempfile.TemporaryDirectory() as directory:
+
+            write_distribution(directory, 'unnamed', {
+                'cmd1': 'click_plugins_tests:cmd1'}, metadata_name=False)
+
+            @with_plugins(
+                'click_plugins_tests.path', path=[directory], lazy=True)
+            @click.group(cls=PluginGroup)
+            def group():
+                """Group with an unnamed distribution."""
+
+            result = self.runner.invoke(group, ['--help'])
+
+        self.assertEqual(0, result.exit_code)
+        self.assertLess(
+            result.output.index('Plugins:'), result.output.index('cmd1'))
+
+    def test_iter_plugin_help(self):
+
+        """Commands can be filtered and are produced one section at a time."""
+
+        ctx = click.Context(self.group, info_name='group')
+        chunks = list(iter_plugin_help(self.group, ctx, prefix='cmd'))
+
+        self.assertEqual(len(self.titles), len(chunks))
+        self.assertIn(self.titles[0], chunks[0])
+        self.assertIn('cmd1', chunks[0])
+        self.assertIn('cmd-3', chunks[-1])
+
+        output = ''.join(chunks)
+        self.assertNotIn('local', output)
+        self.assertNotIn(EP_NO_EXIST_KEY, output)
+        self.assertNotIn('\u2020', output)
+
+        chunks = list(iter_plugin_help(self.group, ctx))
+        self.assertEqual(len(self.titles) + 2, len(chunks))
+        self.assertIn('\u2020 Could not load plugin.', chunks[-1])
+
+
+class TestWarm(unittest.TestCase):
+
+    """Loading plugins before starting worker processes."""
+
+    def setUp(self):
+
+        SlowEntryPoint.load_counts.clear()
+
+        self.entry_points = [
+            SlowEntryPoint('cmd1', 'click_plugins_tests:cmd1', 'warm'),
+            SlowEntryPoint('cmd2', 'click_plugins_tests:cmd2', 'warm'),
+            SlowEntryPoint(EP_NO_EXIST_KEY, EP_NO_EXIST_VALUE, 'warm')]
+
+        @with_plugins(self.entry_points, lazy=True)
+        @click.group()
+        def group():
+            """Warm group."""
+
+        @group.command()
+        def local():
+            """Not a plugin."""
+
+        self.group = group
+
+    def test_warm_plugins(self):
+
+        """Plugins are loaded, and broken plugins are reported separately."""
+
+        manifest, broken = warm_plugins(self.group)
+
+        self.assertEqual(tuple(self.entry_points[:2]), manifest)
+        self.assertEqual(1, len(broken))
+        self.assertIsInstance(broken[0], BrokenCommand)
+        self.assertEqual(EP_NO_EXIST_KEY, broken[0].name)
+        self.assertEqual(
+            {ep.name: 1 for ep in self.entry_points},
+            SlowEntryPoint.load_counts)
+
+        # Already loaded.
+        self.assertEqual((manifest, broken), warm_plugins(self.group))
+        self.assertEqual(
+            {ep.name: 1 for ep in self.entry_points},
+            SlowEntryPoint.load_counts)
+
+        self.assertEqual(manifest, pickle.loads(pickle.dumps(manifest)))
+
+    def test_warm_plugins_names(self):
+
+        """Only some plugins are loaded."""
+
+        # The plugin that does not exist cannot be analyzed statically, so
+        # it was loaded by '@with_plugins()'.
+        self.assertEqual({EP_NO_EXIST_KEY: 1}, SlowEntryPoint.load_counts)
+
+        manifest, broken = warm_plugins(self.group, names=['cmd2'])
+
+        # The manifest still includes plugins that were not loaded, but not
+        # plugins already known to be broken.
+        self.assertEqual(tuple(self.entry_points[:2]), manifest)
+        self.assertEqual([EP_NO_EXIST_KEY], [cmd.name for cmd in broken])
+        self.assertEqual(
+            {'cmd2': 1, EP_NO_EXIST_KEY: 1}, SlowEntryPoint.load_counts)
+
+    def test_warm_plugins_names_str(self):
+
+        """A single name would otherwise match command names by substring."""
+
+        with self.assertRaises(TypeError) as e:
+            warm_plugins(self.group, names='cmd12')
+
+        self.assertIn('cmd12', str(e.exception))
+        self.assertEqual({EP_NO_EXIST_KEY: 1}, SlowEntryPoint.load_counts)
+
+    def test_warm_plugins_eager(self):
+
+        """Plugins must be attached with ``lazy=True``."""
+
+        for entry_points in (self.entry_points[:1], self.entry_points[2:]):
+
+            @with_plugins(entry_points)
+            @with_plugins(self.entry_points[1:2], lazy=True)
+            @click.group()
+            def group():
+                """test_warm_plugins_eager"""
+
+            with self.assertRaises(TypeError) as e:
+                warm_plugins(group)
+
+            self.assertIn('lazy=True', str(e.exception))
+            self.assertIn(entry_points[0].name, str(e.exception))
+
+    def test_warm_plugins_eager_other_group(self):
+
+        """Plugins attached eagerly to one group do not affect another."""
+
+        @with_plugins(self.entry_points[:1])
+        @click.group()
+        def eager():
+            """Eager group."""
+
+        self.group.add_command(eager.commands['cmd1'], 'copy')
+        manifest, broken = warm_plugins(self.group)
+
+        self.assertEqual(tuple(self.entry_points[:2]), manifest)
+        self.assertEqual([EP_NO_EXIST_KEY], [cmd.name for cmd in broken])
+
+        with self.assertRaises(TypeError):
+            warm_plugins(eager)
+
+    def test_spawn(self):
+
+        """Workers build a CLI from a manifest instead of entry points."""
+
+        manifest, _ = warm_plugins(self.group)
+
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(1, mp_context=ctx) as pool:
+            results = list(pool.map(
+                run_from_manifest,
+                [manifest] * 2,
+                [['cmd1', 'something'], [EP_NO_EXIST_KEY]]))
+
+        self.assertEqual((0, f'passed{os.linesep}'), results[0])
+        self.assertEqual(2, results[1][0])
+        self.assertIn('No such command', results[1][1])
+
 
 class Tests(unittest.TestCase):
 